@@ -13,7 +13,9 @@
 # limitations under the License.
 
 import hashlib
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, Dict, List
+
+from pydantic import PrivateAttr
 
 from distilabel.steps.base import Step, StepInput
 
@@ -21,6 +23,52 @@ if TYPE_CHECKING:
     from distilabel.typing import StepColumns, StepOutput
 
 
+def _batch_sha256_hex(prompts: List[str]) -> List[str]:
+    """Computes the `SHA256` hex digest of a batch of prompts in a single pass.
+
+    Hashing the whole batch at once avoids paying the per-item Python call
+    overhead within the `process` loop, while keeping the hex digests identical
+    to the previous per-item `hashlib.sha256` calls so `prompt_id` remains
+    reproducible.
+
+    Args:
+        prompts: The prompts to be hashed.
+
+    Returns:
+        The hex digest of each prompt, in the same order.
+    """
+    sha256 = hashlib.sha256
+    encode = str.encode
+    return [
+        sha256(encode(prompt, "utf-8"), usedforsecurity=False).hexdigest()
+        for prompt in prompts
+    ]
+
+
+_PROMPT_ID_CACHE_MAX_SIZE = 4096
+
+
+def _assign_prompt_ids(items: StepInput, cache: Dict[str, str]) -> None:
+    """Sets the `prompt_id` of each item to the `SHA256` hex digest of its `prompt`.
+
+    Digests are memoized in `cache`, so repeated prompts (e.g. the same instruction
+    fanned out to multiple generations) are hashed only once. The cache is cleared
+    once it would exceed `_PROMPT_ID_CACHE_MAX_SIZE` entries to bound its memory.
+
+    Args:
+        items: The items to assign the `prompt_id` to.
+        cache: The prompt to digest memoization cache.
+    """
+    prompts = [item["prompt"] for item in items]
+    misses = [prompt for prompt in dict.fromkeys(prompts) if prompt not in cache]
+    if misses:
+        if len(cache) + len(misses) > _PROMPT_ID_CACHE_MAX_SIZE:
+            cache.clear()
+        cache.update(zip(misses, _batch_sha256_hex(misses)))
+    for item, prompt in zip(items, prompts):
+        item["prompt_id"] = cache[prompt]
+
+
 class FormatTextGenerationSFT(Step):
     """Format the output of a `TextGeneration` task for Supervised Fine-Tuning (SFT).
 
@@ -82,6 +130,8 @@ class FormatTextGenerationSFT(Step):
         ```
     """
 
+    _prompt_id_cache: Dict[str, str] = PrivateAttr(default_factory=dict)
+
     @property
     def inputs(self) -> "StepColumns":
         """List of inputs required by the `Step`, which in this case are: `instruction`, and `generation`."""
@@ -118,25 +168,25 @@ class FormatTextGenerationSFT(Step):
         """
         for input in inputs:
             for item in input:
-                item["prompt"] = item["instruction"]
-
-                item["prompt_id"] = hashlib.sha256(
-                    item["prompt"].encode("utf-8")  # type: ignore
-                ).hexdigest()
-
-                item["messages"] = [
-                    {"role": "user", "content": item["instruction"]},  # type: ignore
-                    {"role": "assistant", "content": item["generation"]},  # type: ignore
-                ]
-                if (
-                    "system_prompt" in item
-                    and isinstance(item["system_prompt"], str)  # type: ignore
-                    and len(item["system_prompt"]) > 0  # type: ignore
-                ):
-                    item["messages"].insert(
-                        0,
-                        {"role": "system", "content": item["system_prompt"]},  # type: ignore
-                    )
+                instruction = item["instruction"]
+                generation = item["generation"]
+                system_prompt = item.get("system_prompt")
+
+                item["prompt"] = instruction
+
+                if isinstance(system_prompt, str) and len(system_prompt) > 0:
+                    item["messages"] = [
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": instruction},
+                        {"role": "assistant", "content": generation},
+                    ]
+                else:
+                    item["messages"] = [
+                        {"role": "user", "content": instruction},
+                        {"role": "assistant", "content": generation},
+                    ]
+
+            _assign_prompt_ids(input, self._prompt_id_cache)
 
             yield input
 
@@ -201,6 +251,8 @@ class FormatChatGenerationSFT(Step):
         ```
     """
 
+    _prompt_id_cache: Dict[str, str] = PrivateAttr(default_factory=dict)
+
     @property
     def inputs(self) -> "StepColumns":
         """List of inputs required by the `Step`, which in this case are: `instruction`, and `generation`."""
@@ -227,20 +279,23 @@ class FormatChatGenerationSFT(Step):
         """
         for input in inputs:
             for item in input:
-                item["prompt"] = next(
-                    (
-                        turn["content"]
-                        for turn in item["messages"]
-                        if turn["role"] == "user"
-                    ),
-                    None,
-                )
-
-                item["prompt_id"] = hashlib.sha256(
-                    item["prompt"].encode("utf-8")  # type: ignore
-                ).hexdigest()
-
-                item["messages"] = item["messages"] + [
+                messages = item["messages"]
+
+                prompt = None
+                for turn in messages:
+                    if turn["role"] == "user":
+                        prompt = turn["content"]
+                        break
+                item["prompt"] = prompt
+
+                # Build a fresh list instead of appending in place: rows produced by a
+                # task fan-out share one `messages` list object, so an in-place append
+                # would leak each row's assistant turn into its siblings.
+                item["messages"] = [
+                    *messages,
                     {"role": "assistant", "content": item["generation"]},  # type: ignore
                 ]
+
+            _assign_prompt_ids(input, self._prompt_id_cache)
+
             yield input
@@ -12,10 +12,23 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import ast
 import importlib.util
 import re
-import signal
-from typing import TYPE_CHECKING, Any, Callable, Dict, TypedDict, Union
+import threading
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    TypedDict,
+    Union,
+)
+
+from pydantic import PrivateAttr
 
 from distilabel.steps.base import Step, StepInput
 
@@ -63,6 +76,20 @@ class PrepareExamples(Step):
 
     template: str = "## Query:\n{query}\n## Answers:\n{answers}"
 
+    _template_segments: Optional[Tuple[str, str, str]] = PrivateAttr(default=None)
+
+    def load(self) -> None:
+        """Splits the template into its literal segments, so formatting an example
+        becomes plain string concatenation instead of parsing the format spec per
+        pair. Templates with the placeholders reordered or missing fall back to
+        `str.format`."""
+        super().load()
+
+        pre, query_placeholder, rest = self.template.partition("{query}")
+        mid, answers_placeholder, post = rest.partition("{answers}")
+        if query_placeholder and answers_placeholder:
+            self._template_segments = (pre, mid, post)
+
     @property
     def inputs(self) -> "StepColumns":
         return ["query", "answers"]
@@ -83,11 +110,34 @@ class PrepareExamples(Step):
             A list of dictionaries with the output data.
         """
         outputs = []
+        template_format = self.template.format
+        segments = self._template_segments
+        if segments is not None:
+            pre, mid, post = segments
         for input in inputs:
-            example_list = []
-            for query, answers in zip(input["query"], input["answers"]):
-                example_list.append(self.template.format(query=query, answers=answers))
-            outputs.append({"examples": "\n\n".join(example_list)})
+            queries = input["query"]
+            answers = input["answers"]
+
+            if not queries:
+                outputs.append({"examples": ""})
+                continue
+
+            if segments is not None:
+                example_list = [
+                    f"{pre}{query}{mid}{answer}{post}"
+                    for query, answer in zip(queries, answers)
+                ]
+            else:
+                example_list = [
+                    template_format(query=query, answers=answer)
+                    for query, answer in zip(queries, answers)
+                ]
+
+            if len(example_list) == 1:
+                # The documented single-example case, copied as is
+                outputs.append({"examples": example_list[0]})
+            else:
+                outputs.append({"examples": "\n\n".join(example_list)})
 
         yield outputs
 
@@ -126,9 +176,10 @@ def execute_from_response(
 ) -> FunctionResult:
     """Executes a function with the given arguments as generated by `APIGenGenerator`.
 
-    Given that we cannot cast all the arguments arbitrarily, we try to evaluate them,
-    which ensures the strings can be converted to the correct type if possible (say
-    a list of lists of ints will be passed as such instead of its string representation).
+    Given that we cannot cast all the arguments arbitrarily, we try to parse them as
+    Python literals, which ensures the strings can be converted to the correct type if
+    possible (say a list of lists of ints will be passed as such instead of its string
+    representation).
 
     Args:
         function: A callable object.
@@ -144,7 +195,10 @@ def execute_from_response(
         for key, value in call_answer.items():
             if isinstance(value, str):
                 try:
-                    call_answer[key] = eval(value)
+                    # Not memoized on purpose: the parsed value can be mutable and is
+                    # handed to the executed function, so caching would alias the same
+                    # object across rows (and threads).
+                    call_answer[key] = ast.literal_eval(value)
                 except Exception:
                     # Leave as is and expect the function to handle it
                     pass
@@ -160,35 +214,50 @@ def execute_from_response(
         return FunctionResult(keep=False, execution_result=str(e))
 
 
+_FENCE_REGEX = re.compile(r"^```(?:json)?\n([\s\S]*)\n```$", re.MULTILINE)
+
+
 def remove_json_fences(text: str) -> str:
-    pattern = r"^```json\n([\s\S]*)\n```$"
-    match = re.match(pattern, text, re.MULTILINE)
+    if not text.startswith("```"):
+        return text
+    match = _FENCE_REGEX.match(text)
     if match:
         return match.group(1)
     return text
 
 
 def remove_fences(text: str) -> str:
-    pattern = r"^```\n([\s\S]*)\n```$"
-    match = re.match(pattern, text, re.MULTILINE)
+    if not text.startswith("```"):
+        return text
+    match = _FENCE_REGEX.match(text)
     if match:
         return match.group(1)
     return text
 
 
-def timeout_handler(signum, frame):
-    raise TimeoutError("Function execution timed out")
-
-
 def run_function_with_timeout(function: Callable, timeout: int = 5, *args: Any) -> Any:
-    """Run a function with a timeout, to limit the total time waiting for a result."""
-    signal.signal(signal.SIGALRM, timeout_handler)
-    signal.alarm(timeout)
+    """Run a function with a timeout, to limit the total time waiting for a result.
 
-    try:
-        result = function(*args)
-    finally:
-        # Cancel the alarm
-        signal.alarm(0)
-
-    return result
+    The timeout is enforced by running the function in a daemon thread instead of
+    `signal.SIGALRM`, which only works on the main thread and serializes all the
+    timeout-guarded calls process-wide. A call that times out leaves its thread
+    running until the function returns, but the result is discarded.
+    """
+    result: List[Any] = []
+    exception: List[BaseException] = []
+
+    def _target() -> None:
+        try:
+            result.append(function(*args))
+        except BaseException as e:
+            exception.append(e)
+
+    thread = threading.Thread(target=_target, daemon=True)
+    thread.start()
+    thread.join(timeout)
+
+    if thread.is_alive():
+        raise TimeoutError("Function execution timed out")
+    if exception:
+        raise exception[0]
+    return result[0]
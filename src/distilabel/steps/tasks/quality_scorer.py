@@ -20,8 +20,10 @@ if sys.version_info < (3, 9):
 else:
     import importlib.resources as importlib_resources
 
-from typing import Any, Dict, List, Union
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple, Union
 
+import numpy as np
 import orjson
 from jinja2 import Template
 from pydantic import PrivateAttr
@@ -30,7 +32,27 @@ from typing_extensions import override
 from distilabel.steps.tasks.base import Task
 from distilabel.typing import ChatType
 
-_PARSE_SCORE_LINE_REGEX = re.compile(r"\[\d+\] score: (\d+)", re.IGNORECASE)
+_PARSE_SCORE_LINE_PATTERN = r"(?im)^\[\d+\] score: (\d+)"
+
+try:
+    # `google-re2` compiles to a linear-time DFA, so adversarial LLM outputs cannot
+    # trigger the worst-case backtracking of the stdlib `re` engine.
+    import re2
+
+    _PARSE_SCORE_LINE_REGEX = re2.compile(_PARSE_SCORE_LINE_PATTERN)
+except ImportError:
+    _PARSE_SCORE_LINE_REGEX = re.compile(_PARSE_SCORE_LINE_PATTERN)
+
+_TEMPLATE_CACHE: Dict[str, Template] = {}
+
+
+@lru_cache(maxsize=256)
+def _render_template(
+    template: Template, instruction: str, responses: Tuple[str, ...]
+) -> str:
+    """Renders the template, memoizing the output as identical inputs render
+    identically."""
+    return template.render(instruction=instruction, responses=responses)
 
 
 class QualityScorer(Task):
@@ -150,7 +172,7 @@ class QualityScorer(Task):
     _can_be_used_with_offline_batch_generation = True
 
     def load(self) -> None:
-        """Loads the Jinja2 template."""
+        """Loads the Jinja2 template, compiling it only once per template path."""
         super().load()
 
         _path = str(
@@ -161,7 +183,10 @@ class QualityScorer(Task):
             / "quality-scorer.jinja2"
         )
 
-        self._template = Template(open(_path).read())
+        template = _TEMPLATE_CACHE.get(_path)
+        if template is None:
+            template = _TEMPLATE_CACHE.setdefault(_path, Template(open(_path).read()))
+        self._template = template
 
     @property
     def inputs(self) -> List[str]:
@@ -174,8 +199,10 @@ class QualityScorer(Task):
         return [
             {
                 "role": "user",
-                "content": self._template.render(  # type: ignore
-                    instruction=input["instruction"], responses=input["responses"]
+                "content": _render_template(
+                    self._template,  # type: ignore
+                    input["instruction"],
+                    tuple(input["responses"]),
                 ),
             }
         ]
@@ -204,15 +231,10 @@ class QualityScorer(Task):
         if self.use_default_structured_output:
             return self._format_structured_output(output, input)
 
-        scores = []
-        score_lines = output.split("\n")
-
-        for i, line in enumerate(score_lines):
-            match = _PARSE_SCORE_LINE_REGEX.match(line)
-            score = float(match.group(1)) if match else None
-            scores.append(score)
-            if i == len(input["responses"]) - 1:
-                break
+        num_responses = len(input["responses"])
+        matches = _PARSE_SCORE_LINE_REGEX.findall(output)[:num_responses]
+        scores = np.fromiter(matches, dtype=np.float64, count=len(matches)).tolist()
+        scores += [None] * (num_responses - len(scores))
         return {"scores": scores}
 
     @override
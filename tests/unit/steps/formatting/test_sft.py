@@ -101,3 +101,28 @@ class TestFormatChatGenerationSFT:
                 "prompt_id": "7762ecf17ad41479767061a8f4a7bfa3b63d371672af5180872f9b82b4cd4e29",
             }
         ]
+
+    def test_process_with_shared_messages(self) -> None:
+        step = FormatChatGenerationSFT(name="sft", pipeline=Pipeline(name="pipeline"))
+        step.load()
+
+        # Rows produced by a task fan-out share the same `messages` list object,
+        # so each row must get its own conversation.
+        messages = [{"role": "user", "content": "What's 2+2?"}]
+        result = next(
+            step.process(
+                [
+                    {"messages": messages, "generation": "4"},
+                    {"messages": messages, "generation": "2+2 is 4"},
+                ]
+            )
+        )
+
+        assert result[0]["messages"] == [
+            {"role": "user", "content": "What's 2+2?"},
+            {"role": "assistant", "content": "4"},
+        ]
+        assert result[1]["messages"] == [
+            {"role": "user", "content": "What's 2+2?"},
+            {"role": "assistant", "content": "2+2 is 4"},
+        ]
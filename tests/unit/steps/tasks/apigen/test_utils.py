@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import time
 from pathlib import Path
 from typing import Any, Dict
 
@@ -20,6 +21,7 @@ import pytest
 from distilabel.steps.tasks.apigen.utils import (
     execute_from_response,
     load_module_from_path,
+    run_function_with_timeout,
 )
 
 
@@ -75,3 +77,24 @@ def test_execute_from_response(
     final_velocity = getattr(libpath, function_name, None)
     result = execute_from_response(final_velocity, answer)
     assert result == expected_result
+
+
+def test_run_function_with_timeout_returns_result():
+    assert run_function_with_timeout(lambda a, b: a + b, 5, 1, 2) == 3
+
+
+def test_run_function_with_timeout_raises_timeout_error():
+    with pytest.raises(TimeoutError, match="Function execution timed out"):
+        run_function_with_timeout(time.sleep, 1, 3)
+
+
+def test_run_function_with_timeout_reraises_exception():
+    with pytest.raises(ZeroDivisionError):
+        run_function_with_timeout(lambda: 1 / 0, 5)
+
+
+def test_run_function_with_timeout_works_off_the_main_thread():
+    result = run_function_with_timeout(
+        run_function_with_timeout, 5, lambda a, b: a + b, 5, 1, 2
+    )
+    assert result == 3